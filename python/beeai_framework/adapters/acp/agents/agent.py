@@ -1,13 +1,12 @@
 # Copyright 2025 © BeeAI a Series of LF Projects, LLC
 # SPDX-License-Identifier: Apache-2.0
 
-from functools import reduce
-
 from beeai_framework.utils.strings import to_safe_word
 
 try:
     import acp_sdk.client as acp_client
     import acp_sdk.models as acp_models
+    import httpx
 
     from beeai_framework.adapters.acp.agents.events import (
         ACPAgentErrorEvent,
@@ -32,14 +31,28 @@ from beeai_framework.runnable import runnable_entry
 
 
 class ACPAgent(BaseAgent[ACPAgentOutput]):
+    """Agent that runs a remote agent exposed over the Agent Communication Protocol (ACP).
+
+    Pass an `http_client` to reuse its connection pool across runs, clones and other agents. The caller owns that
+    client and is responsible for closing it. Without one, each call opens its own connection.
+    """
+
     def __init__(
-        self, agent_name: str, *, url: str, memory: BaseMemory, session: acp_models.Session | None = None
+        self,
+        agent_name: str,
+        *,
+        url: str,
+        memory: BaseMemory,
+        session: acp_models.Session | None = None,
+        http_client: httpx.AsyncClient | None = None,
     ) -> None:
         super().__init__()
         self._memory = memory
         self._url = url
         self._name = agent_name
         self._session = session or acp_models.Session()
+        # a client passed by the caller can be shared by many agents and is never closed by the agent
+        self._http_client = http_client
 
     @property
     def name(self) -> str:
@@ -54,7 +67,7 @@ class ACPAgent(BaseAgent[ACPAgentOutput]):
     ) -> ACPAgentOutput:
         async def handler(context: RunContext) -> ACPAgentOutput:
             async with (
-                acp_client.Client(base_url=self._url, manage_client=False, session=self._session) as client,
+                self._create_client(session=self._session) as client,
             ):
                 inputs = (
                     [self._convert_to_agent_stack_message(i) for i in input]
@@ -64,7 +77,7 @@ class ACPAgent(BaseAgent[ACPAgentOutput]):
                 )
 
                 last_event = None
-                async for event in client.run_stream(agent=self._name, input=inputs):
+                async for event in client.run_stream(agent=self._name, input=inputs, base_url=self._url):
                     last_event = event
                     await context.emitter.emit(
                         "update",
@@ -86,7 +99,7 @@ class ACPAgent(BaseAgent[ACPAgentOutput]):
                     )
                     raise AgentError(message)
                 elif isinstance(last_event, acp_models.RunCompletedEvent):
-                    response = str(reduce(lambda x, y: x + y, last_event.run.output))
+                    response = "".join(str(message) for message in last_event.run.output)
 
                     input_messages = (
                         [self._convert_to_framework_message(i) for i in input]
@@ -109,14 +122,20 @@ class ACPAgent(BaseAgent[ACPAgentOutput]):
         self,
     ) -> None:
         try:
-            async with acp_client.Client(base_url=self._url) as client:
-                agents = [agent async for agent in client.agents()]
+            async with self._create_client() as client:
+                agents = [agent async for agent in client.agents(base_url=self._url)]
                 agent = any(agent.name == self._name for agent in agents)
                 if not agent:
                     raise AgentError(f"Agent {self._name} does not exist.")
         except Exception as e:
             raise AgentError("Can't connect to ACP agent.", cause=e)
 
+    def _create_client(self, session: acp_models.Session | None = None) -> acp_client.Client:
+        if self._http_client is None:
+            # the client created by acp_sdk only lives for this call, so it is closed on exit
+            return acp_client.Client(base_url=self._url, session=session)
+        return acp_client.Client(client=self._http_client, manage_client=False, session=session)
+
     def _create_emitter(self) -> Emitter:
         return Emitter.root().child(
             namespace=["acp", "agent", to_safe_word(self._name)],
@@ -133,7 +152,12 @@ class ACPAgent(BaseAgent[ACPAgentOutput]):
         self._memory = memory
 
     async def clone(self) -> "ACPAgent":
-        cloned = ACPAgent(self._name, url=self._url, memory=await self.memory.clone())
+        cloned = ACPAgent(
+            self._name,
+            url=self._url,
+            memory=await self.memory.clone(),
+            http_client=self._http_client,
+        )
         cloned.emitter = await self.emitter.clone()
         return cloned
 
@@ -110,6 +110,7 @@ class AgentstackEmbeddingModel(EmbeddingModel):
             base_url=embedding_conf.api_base,
             settings=self._settings,
             middlewares=self.middlewares,
+            cache=self.cache,
         )
 
         self._model_by_context[embedding_ext] = model
@@ -136,6 +137,7 @@ class AgentstackEmbeddingModel(EmbeddingModel):
         cloned = self.__class__(
             preferred_models=self.preferred_models.copy(),
             settings=self._settings.copy(),
+            cache=await self.cache.clone(),
         )
         cloned.middlewares.extend(self.middlewares)
         return cloned
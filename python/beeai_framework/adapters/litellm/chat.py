@@ -218,19 +218,6 @@ class LiteLLMChatModel(ChatModel, ABC):
             else:
                 messages.append(message.to_plain())
 
-        tools = [
-            {
-                "type": "function",
-                "function": {
-                    "name": tool.name,
-                    "description": tool.description,
-                    "parameters": self._format_tool_model(tool.input_schema),
-                    "strict": self.use_strict_tool_schema,
-                },
-            }
-            for tool in input.tools or []
-        ]
-
         settings = exclude_keys(
             self._settings | input.model_dump(exclude_unset=True),
             {
@@ -253,41 +240,53 @@ class LiteLLMChatModel(ChatModel, ABC):
             set(self.supported_params),
         )
 
-        tool_choice: dict[str, Any] | str | AnyTool | None = input.tool_choice
-        if input.tool_choice == "none" and input.tool_choice not in self._tool_choice_support:
-            tool_choice = None
-            tools = []
-        elif input.tool_choice == "auto" and input.tool_choice not in self._tool_choice_support:
-            tool_choice = None
-        elif isinstance(input.tool_choice, Tool) and "single" in self._tool_choice_support:
-            tool_choice = {"type": "function", "function": {"name": input.tool_choice.name}}
-        elif input.tool_choice not in self._tool_choice_support:
-            tool_choice = None
-
-        if input.response_format:
-            tools = []
-            tool_choice = None
+        tools: list[dict[str, Any]] = []
+        tool_choice: dict[str, Any] | str | AnyTool | None = None
+        if not input.response_format:
+            tools = [
+                {
+                    "type": "function",
+                    "function": {
+                        "name": tool.name,
+                        "description": tool.description,
+                        "parameters": self._format_tool_model(tool.input_schema),
+                        "strict": self.use_strict_tool_schema,
+                    },
+                }
+                for tool in input.tools or []
+            ]
+
+            tool_choice = input.tool_choice
+            if input.tool_choice == "none" and input.tool_choice not in self._tool_choice_support:
+                tool_choice = None
+                tools = []
+            elif input.tool_choice == "auto" and input.tool_choice not in self._tool_choice_support:
+                tool_choice = None
+            elif isinstance(input.tool_choice, Tool) and "single" in self._tool_choice_support:
+                tool_choice = {"type": "function", "function": {"name": input.tool_choice.name}}
+            elif input.tool_choice not in self._tool_choice_support:
+                tool_choice = None
 
         if not self.allow_prompt_caching:
             attr = "cache_control_injection_points"
             params.pop(attr, None)
             settings.pop(attr, None)
 
-        return exclude_none(
-            exclude_none(settings)
-            | exclude_none(params)
-            | {
-                "model": f"{self._litellm_provider_id}/{self.model_id}",
-                "messages": messages,
-                "tools": tools if tools else None,
-                "response_format": self._format_response_model(input.response_format)
-                if input.response_format
-                else None,
-                "max_retries": 0,
-                "tool_choice": tool_choice if tools else None,
-                "parallel_tool_calls": bool(input.parallel_tool_calls) if tools else None,
-            }
-        )
+        request = {k: v for source in (settings, params) for k, v in source.items() if v is not None}
+        request["model"] = f"{self._litellm_provider_id}/{self.model_id}"
+        request["messages"] = messages
+        request["max_retries"] = 0
+        for key, value in (
+            ("tools", tools or None),
+            ("response_format", self._format_response_model(input.response_format) if input.response_format else None),
+            ("tool_choice", tool_choice if tools else None),
+            ("parallel_tool_calls", bool(input.parallel_tool_calls) if tools else None),
+        ):
+            if value is None:
+                request.pop(key, None)
+            else:
+                request[key] = value
+        return request
 
     def _transform_output(self, chunk: ModelResponse | ModelResponseStream) -> ChatModelOutput:
         model = chunk.get("model")
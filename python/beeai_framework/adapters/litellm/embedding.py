@@ -122,7 +122,10 @@ class LiteLLMEmbeddingModel(EmbeddingModel, ABC):
 
     async def clone(self) -> Self:
         instance: Self = safe_invoke(self.__class__)(
-            model_id=self._model_id, provider_id=self._litellm_provider_id, settings=self._settings.copy()
+            model_id=self._model_id,
+            provider_id=self._litellm_provider_id,
+            settings=self._settings.copy(),
+            cache=await self.cache.clone(),
         )
         instance.middlewares.extend(self.middlewares)
         return instance
@@ -7,27 +7,32 @@ from transformers import (
     StoppingCriteria,
 )
 
-from beeai_framework.backend.types import (
-    ChatModelParameters,
-)
 
+def get_balanced_max_memory(first_gpu_ratio: float = 0.7, gpu_ratio: float = 0.9) -> dict[int | str, str] | None:
+    """Leaves extra headroom on the first GPU, which holds the inputs, activations and the growing KV cache.
 
-def get_do_sample(input: ChatModelParameters) -> bool:
-    return bool(
-        input.temperature > 0.0
-        or (input.top_k is not None and input.top_k > 1)
-        or input.top_p is not None
-        or (input.n is not None and input.n > 1)
-    )
+    The available CPU memory is included as well, so `device_map="auto"` can still offload layers that do not fit.
+    """
+    device_count = torch.cuda.device_count() if torch.cuda.is_available() else 0
+    if device_count < 2:
+        return None
 
+    # psutil is not a declared dependency, it comes with accelerate which multi GPU loading requires anyway
+    import psutil
 
-def get_num_beams(input: ChatModelParameters) -> int:
-    return input.n if input.n is not None else 1
+    max_memory: dict[int | str, str] = {}
+    for idx in range(device_count):
+        free, _ = torch.cuda.mem_get_info(idx)
+        ratio = first_gpu_ratio if idx == 0 else gpu_ratio
+        max_memory[idx] = f"{int(free * ratio) // 2**20}MiB"
+    max_memory["cpu"] = f"{psutil.virtual_memory().available // 2**20}MiB"
+    return max_memory
 
 
 class CustomStoppingCriteria(StoppingCriteria):
-    def __init__(self, stop_token_ids: list[int], prompt_tokens: int) -> None:
-        self.stop_token_ids = torch.tensor(stop_token_ids, dtype=torch.long)
+    def __init__(self, stop_token_ids: list[int], prompt_tokens: int, device: torch.device | str | int) -> None:
+        # Allocate on the device of the generated ids to avoid per-token device checks
+        self.stop_token_ids = torch.as_tensor(stop_token_ids, dtype=torch.long, device=device)
         self.prompt_tokens = prompt_tokens
 
     def __call__(self, input_ids: torch.LongTensor, scores: torch.FloatTensor, **kwargs: Any) -> bool:
@@ -38,10 +43,6 @@ class CustomStoppingCriteria(StoppingCriteria):
         if stop_len == 0:
             return False
 
-        # Move tensor to the correct device on the first call
-        if self.stop_token_ids.device != input_ids.device:
-            self.stop_token_ids = self.stop_token_ids.to(input_ids.device)
-
         # Check if the last `stop_len` tokens match the stop sequence
         return (input_ids.shape[1] >= (self.prompt_tokens + stop_len)) and torch.equal(
             input_ids[0, -stop_len:], self.stop_token_ids
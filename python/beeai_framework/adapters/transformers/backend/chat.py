@@ -18,15 +18,10 @@ from transformers import (
     PreTrainedTokenizerBase,
     StoppingCriteria,
     TextIteratorStreamer,
-    set_seed,
 )
 
 from beeai_framework.adapters.litellm.utils import to_strict_json_schema
-from beeai_framework.adapters.transformers.backend._utils import (
-    CustomStoppingCriteria,
-    get_do_sample,
-    get_num_beams,
-)
+from beeai_framework.adapters.transformers.backend._utils import CustomStoppingCriteria, get_balanced_max_memory
 from beeai_framework.backend.chat import ChatModel, ChatModelKwargs
 from beeai_framework.backend.constants import ProviderName
 from beeai_framework.backend.message import (
@@ -71,6 +66,8 @@ class TransformersChatModel(ChatModel):
         tokenizer_kwargs: dict[str, Any] | None = None,
         model_kwargs: dict[str, Any] | None = None,
         qlora_kwargs: dict[str, Any] | None = None,
+        max_memory: dict[int | str, str] | None = None,
+        balance_first_gpu: bool = False,
         **kwargs: Unpack[ChatModelKwargs],
     ) -> None:
         super().__init__(**kwargs)
@@ -84,11 +81,16 @@ class TransformersChatModel(ChatModel):
             PreTrainedTokenizerBase,
             AutoTokenizer.from_pretrained(model_id, token=hf_token, **(tokenizer_kwargs or {})),
         )
+        # device_map="auto" tends to fill the first GPU, balance_first_gpu leaves room for activations on it
+        model_kwargs = model_kwargs or {}
+        if "max_memory" not in model_kwargs:
+            max_memory = max_memory or (get_balanced_max_memory() if balance_first_gpu else None)
+            model_kwargs = {**model_kwargs, "max_memory": max_memory} if max_memory else model_kwargs
         model_base = AutoModelForCausalLM.from_pretrained(
             self._model_id,
             device_map="auto",
             token=hf_token,
-            **(model_kwargs or {}),
+            **model_kwargs,
         )
         self._model: Any = (
             model_base
@@ -206,36 +208,35 @@ class TransformersChatModel(ChatModel):
                 # TODO: might incorrectly handle some non-text messages
                 messages.append({"role": message.role, "content": message.text})
 
-        tools = [
-            {
-                "type": "function",
-                "function": {
-                    "name": tool.name,
-                    "description": tool.description,
-                    "parameters": self._format_tool_model(tool.input_schema),
-                    "strict": self.use_strict_tool_schema,
-                },
-            }
-            for tool in input.tools or []
-        ]
-
-        tool_choice: dict[str, Any] | str | AnyTool | None = input.tool_choice
-        if input.tool_choice == "none" and input.tool_choice not in self._tool_choice_support:
-            tool_choice = None
-            tools = []
-        elif input.tool_choice == "auto" and input.tool_choice not in self._tool_choice_support:
-            tool_choice = None
-        elif isinstance(input.tool_choice, Tool) and "single" in self._tool_choice_support:
-            tool_choice = {
-                "type": "function",
-                "function": {"name": input.tool_choice.name},
-            }
-        elif input.tool_choice not in self._tool_choice_support:
-            tool_choice = None
+        tools: list[dict[str, Any]] = []
+        tool_choice: dict[str, Any] | str | AnyTool | None = None
+        if not input.response_format:
+            tools = [
+                {
+                    "type": "function",
+                    "function": {
+                        "name": tool.name,
+                        "description": tool.description,
+                        "parameters": self._format_tool_model(tool.input_schema),
+                        "strict": self.use_strict_tool_schema,
+                    },
+                }
+                for tool in input.tools or []
+            ]
 
-        if input.response_format:
-            tools = []
-            tool_choice = None
+            tool_choice = input.tool_choice
+            if input.tool_choice == "none" and input.tool_choice not in self._tool_choice_support:
+                tool_choice = None
+                tools = []
+            elif input.tool_choice == "auto" and input.tool_choice not in self._tool_choice_support:
+                tool_choice = None
+            elif isinstance(input.tool_choice, Tool) and "single" in self._tool_choice_support:
+                tool_choice = {
+                    "type": "function",
+                    "function": {"name": input.tool_choice.name},
+                }
+            elif input.tool_choice not in self._tool_choice_support:
+                tool_choice = None
 
         return {
             "model": f"{self.provider_id}/{self.model_id}",
@@ -253,6 +254,7 @@ class TransformersChatModel(ChatModel):
                 CustomStoppingCriteria(
                     self.tokenizer.encode(stop_word, add_prefix_space=False),
                     prompt_tokens,
+                    self._device_first_layer,
                 )
                 for stop_word in input.stop_sequences
             ]
@@ -277,19 +279,19 @@ class TransformersChatModel(ChatModel):
         prompt_tokens = inputs["input_ids"].shape[1]
         inputs_on_device = {k: v.to(self._device_first_layer) for k, v in inputs.items()}
 
-        if input.seed is not None:
-            set_seed(input.seed)
-
+        temperature, top_k, top_p, n = input.temperature, input.top_k, input.top_p, input.n
         kwargs = {
             "streamer": streamer,
             "max_new_tokens": input.max_tokens,
-            "temperature": input.temperature,
-            "top_k": input.top_k,
-            "top_p": input.top_p,
-            "num_beams": get_num_beams(input),
+            "temperature": temperature,
+            "top_k": top_k,
+            "top_p": top_p,
+            "num_beams": n if n is not None else 1,
             "frequency_penalty": input.frequency_penalty,
             "presence_penalty": input.presence_penalty,
-            "do_sample": get_do_sample(input),
+            "do_sample": bool(
+                temperature > 0.0 or (top_k is not None and top_k > 1) or top_p is not None or (n is not None and n > 1)
+            ),
             "stopping_criteria": self._get_stopping_criteria(input, prompt_tokens),
         }
         if input.response_format:
@@ -302,7 +304,9 @@ class TransformersChatModel(ChatModel):
                 ),
             )
             model_output = await asyncio.to_thread(
-                generator,  # type: ignore
+                self._run_generation,
+                generator,
+                input.seed,
                 Chat(llm_input["messages"]),
                 **kwargs,
             )
@@ -314,7 +318,9 @@ class TransformersChatModel(ChatModel):
             return model_output, model_parsed_output
         else:
             model_output = await asyncio.to_thread(
+                self._run_generation,
                 self._model.generate,
+                input.seed,
                 **inputs_on_device,
                 **kwargs,
             )
@@ -323,6 +329,16 @@ class TransformersChatModel(ChatModel):
             generated_text = cast(str, self.tokenizer.decode(generated_tokens, skip_special_tokens=True))
             return generated_text, None
 
+    @staticmethod
+    def _run_generation(fn: Any, seed: int | None, *args: Any, **kwargs: Any) -> Any:
+        # Sampling only consumes torch's RNG, so there is no need to reseed python's `random` and numpy
+        # (as `transformers.set_seed` does). Seeding happens in the worker thread, off the event loop.
+        if seed is not None:
+            torch.manual_seed(seed)
+        # inference_mode is thread-local, so it has to be entered inside the worker thread
+        with torch.inference_mode():
+            return fn(*args, **kwargs)
+
     def _format_tool_model(self, model: type[BaseModel]) -> dict[str, Any]:
         return to_strict_json_schema(model) if self.use_strict_tool_schema else model.model_json_schema()
 
@@ -1,9 +1,22 @@
 # Copyright 2025 © BeeAI a Series of LF Projects, LLC
 # SPDX-License-Identifier: Apache-2.0
 
-from beeai_framework.adapters.watsonx_orchestrate.serve.server import (
-    WatsonxOrchestrateServer,
-    WatsonxOrchestrateServerConfig,
-)
+from typing import TYPE_CHECKING
+
+from beeai_framework.utils.modules import lazy_module_getattr
+
+if TYPE_CHECKING:
+    from beeai_framework.adapters.watsonx_orchestrate.serve.server import (
+        WatsonxOrchestrateServer,
+        WatsonxOrchestrateServerConfig,
+    )
 
 __all__ = ["WatsonxOrchestrateServer", "WatsonxOrchestrateServerConfig"]
+
+__getattr__ = lazy_module_getattr(
+    __name__,
+    {
+        "WatsonxOrchestrateServer": "beeai_framework.adapters.watsonx_orchestrate.serve.server",
+        "WatsonxOrchestrateServerConfig": "beeai_framework.adapters.watsonx_orchestrate.serve.server",
+    },
+)
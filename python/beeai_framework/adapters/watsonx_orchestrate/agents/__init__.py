@@ -1,11 +1,19 @@
 # Copyright 2025 © BeeAI a Series of LF Projects, LLC
 # SPDX-License-Identifier: Apache-2.0
 
+from typing import TYPE_CHECKING
 
-from beeai_framework.adapters.watsonx_orchestrate.agents.agent import WatsonxOrchestrateAgent
 from beeai_framework.adapters.watsonx_orchestrate.agents.types import WatsonxOrchestrateAgentOutput
+from beeai_framework.utils.modules import lazy_module_getattr
+
+if TYPE_CHECKING:
+    from beeai_framework.adapters.watsonx_orchestrate.agents.agent import WatsonxOrchestrateAgent
 
 __all__ = [
     "WatsonxOrchestrateAgent",
     "WatsonxOrchestrateAgentOutput",
 ]
+
+__getattr__ = lazy_module_getattr(
+    __name__, {"WatsonxOrchestrateAgent": "beeai_framework.adapters.watsonx_orchestrate.agents.agent"}
+)
@@ -4,6 +4,7 @@
 import asyncio
 import json
 from asyncio import create_task
+from collections.abc import Mapping, Sequence
 from typing import Any
 
 from pydantic import BaseModel, InstanceOf
@@ -15,8 +16,15 @@ from beeai_framework.tools import AnyTool, StringToolOutput, ToolError, ToolOutp
 from beeai_framework.utils.strings import to_json
 
 
+def index_tools(tools: Sequence[AnyTool]) -> dict[str, AnyTool]:
+    tools_by_name: dict[str, AnyTool] = {}
+    for tool in tools:
+        tools_by_name.setdefault(tool.name, tool)  # the first tool with a given name wins
+    return tools_by_name
+
+
 async def run_tool(
-    tools: list[AnyTool],
+    tools: Sequence[AnyTool] | Mapping[str, AnyTool],
     msg: MessageToolCallContent,
     context: dict[str, Any],
 ) -> "ToolInvocationResult":
@@ -35,7 +43,7 @@ async def run_tool(
     )
 
     try:
-        result.tool = next((ability for ability in tools if ability.name == msg.tool_name), None)
+        result.tool = (tools if isinstance(tools, Mapping) else index_tools(tools)).get(msg.tool_name)
         if not result.tool:
             raise ToolError(f"Tool '{msg.tool_name}' does not exist!")
 
@@ -48,10 +56,13 @@ async def run_tool(
 
 
 async def run_tools(
-    tools: list[AnyTool], messages: list[MessageToolCallContent], context: dict[str, Any]
+    tools: Sequence[AnyTool] | Mapping[str, AnyTool],
+    messages: list[MessageToolCallContent],
+    context: dict[str, Any],
 ) -> list["ToolInvocationResult"]:
+    tools_by_name = tools if isinstance(tools, Mapping) else index_tools(tools)
     return await asyncio.gather(
-        *(create_task(run_tool(tools, msg=msg, context=context)) for msg in messages),
+        *(create_task(run_tool(tools_by_name, msg=msg, context=context)) for msg in messages),
         return_exceptions=False,
     )
 
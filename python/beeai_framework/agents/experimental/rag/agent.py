@@ -1,6 +1,7 @@
 # Copyright 2025 © BeeAI a Series of LF Projects, LLC
 # SPDX-License-Identifier: Apache-2.0
 
+import asyncio
 from typing import Unpack
 
 from beeai_framework.agents import AgentMeta, AgentOptions, AgentOutput, BaseAgent
@@ -34,6 +35,7 @@ class RAGAgent(BaseAgent):
         self.reranker = reranker
         self.number_of_retrieved_documents = number_of_retrieved_documents
         self.documents_threshold = documents_threshold
+        self._system_message = SystemMessage("You are a helpful agent, answer based only on the context.")
 
     def _create_emitter(self) -> Emitter:
         return Emitter.root().child(
@@ -59,17 +61,19 @@ class RAGAgent(BaseAgent):
                 "Invalid input. The input must be a non-empty string or list of messages when memory is empty."
             )
 
-        if isinstance(input, str):
-            text_input = input
-            await self.memory.add(UserMessage(text_input))
-        else:
-            await self.memory.add_many(input)
-            text_input = input[-1].text if input else ""
+        new_messages = [UserMessage(input)] if isinstance(input, str) else input
+        text_input = new_messages[-1].text if new_messages else ""
 
         context = RunContext.get()
 
         try:
-            retrieved_docs = await self.vector_store.search(text_input, k=self.number_of_retrieved_documents)
+            # the retrieval only depends on the input text, so it runs while the new messages are stored
+            memory_write = asyncio.create_task(self.memory.add_many(new_messages))
+            try:
+                retrieved_docs = await self.vector_store.search(text_input, k=self.number_of_retrieved_documents)
+            finally:
+                # the new messages must be stored before anything else (incl. an error message) is added
+                await memory_write
 
             # Apply re-ranking
             if self.reranker:
@@ -84,7 +88,7 @@ class RAGAgent(BaseAgent):
             input_message = UserMessage(content=f"The context for replying to the query is:\n\n{docs_content}")
 
             messages = [
-                SystemMessage("You are a helpful agent, answer based only on the context."),
+                self._system_message,
                 *self.memory.messages,
                 input_message,
             ]
@@ -17,6 +17,7 @@ from beeai_framework.backend import (
     ToolMessage,
     UserMessage,
 )
+from beeai_framework.backend.chat import ChatModelOptions
 from beeai_framework.context import RunContext, RunMiddlewareType
 from beeai_framework.emitter import Emitter
 from beeai_framework.logger import Logger
@@ -100,6 +101,11 @@ class LiteAgent(BaseAgent):
         max_iterations = kwargs.get("max_iterations") or inf
 
         max_retries_per_step = kwargs.get("max_retries_per_step", 3) or 0
+        llm_options: ChatModelOptions = {
+            "tools": self._tools,
+            "signal": ctx.signal,
+            "max_retries": max_retries_per_step,
+        }
 
         final_answer_emitted = False
         final_response: ChatModelOutput | None = None
@@ -109,12 +115,7 @@ class LiteAgent(BaseAgent):
             if iteration > max_iterations:
                 raise AgentError(f"Agent was not able to resolve the task in {max_iterations} iterations.")
 
-            async for data, _ in self._llm.run(
-                run_memory.messages,
-                tools=self._tools,
-                signal=ctx.signal,
-                max_retries=max_retries_per_step,
-            ):
+            async for data, _ in self._llm.run(run_memory.messages, **llm_options):
                 match data:
                     case ChatModelNewTokenEvent(value=response):
                         if response.get_text_content():
@@ -125,23 +126,25 @@ class LiteAgent(BaseAgent):
                         await run_memory.add_many(response.output)
 
                         tool_calls = response.get_tool_calls()
-                        for tool_call in await run_tools(
+                        tool_results = await run_tools(
                             tools=self._tools,
                             messages=tool_calls,
                             context={"state": {"memory": run_memory}},
-                        ):
+                        )
+                        for tool_call in tool_results:
                             if tool_call.error is not None:
                                 raise tool_call.error
 
-                            await run_memory.add(
-                                ToolMessage(
-                                    MessageToolResultContent(
-                                        tool_name=tool_call.tool.name if tool_call.tool else tool_call.msg.tool_name,
-                                        tool_call_id=tool_call.msg.id,
-                                        result=tool_call.output.get_text_content(),
-                                    )
+                        await run_memory.add_many(
+                            ToolMessage(
+                                MessageToolResultContent(
+                                    tool_name=tool_call.tool.name if tool_call.tool else tool_call.msg.tool_name,
+                                    tool_call_id=tool_call.msg.id,
+                                    result=tool_call.output.get_text_content(),
                                 )
                             )
+                            for tool_call in tool_results
+                        )
 
                         if not tool_calls:
                             final_response = response
@@ -174,7 +177,7 @@ class LiteAgent(BaseAgent):
         cloned = LiteAgent(
             llm=await self._llm.clone(),
             memory=await self._memory.clone(),
-            tools=self._tools.copy(),
+            tools=self._tools,
             name=self._name,
             description=self._description,
             middlewares=self.middlewares.copy(),
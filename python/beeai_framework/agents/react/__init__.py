@@ -1,8 +1,8 @@
 # Copyright 2025 © BeeAI a Series of LF Projects, LLC
 # SPDX-License-Identifier: Apache-2.0
 
+from typing import TYPE_CHECKING
 
-from beeai_framework.agents.react.agent import ReActAgent
 from beeai_framework.agents.react.events import (
     ReActAgentErrorEvent,
     ReActAgentRetryEvent,
@@ -11,6 +11,10 @@ from beeai_framework.agents.react.events import (
     ReActAgentUpdateEvent,
 )
 from beeai_framework.agents.react.types import ReActAgentOutput, ReActAgentTemplateFactory
+from beeai_framework.utils.modules import lazy_module_getattr
+
+if TYPE_CHECKING:
+    from beeai_framework.agents.react.agent import ReActAgent
 
 __all__ = [
     "ReActAgent",
@@ -22,3 +26,5 @@ __all__ = [
     "ReActAgentTemplateFactory",
     "ReActAgentUpdateEvent",
 ]
+
+__getattr__ = lazy_module_getattr(__name__, {"ReActAgent": "beeai_framework.agents.react.agent"})
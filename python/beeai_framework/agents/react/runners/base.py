@@ -3,6 +3,7 @@
 
 import math
 from abc import ABC, abstractmethod
+from functools import cached_property
 from typing import Any, Self
 
 from pydantic import BaseModel, InstanceOf
@@ -120,7 +121,7 @@ class BaseRunner(ABC):
     async def _init_memory(self, input: ReActAgentRunInput) -> BaseMemory:
         pass
 
-    @property
+    @cached_property
     def templates(self) -> ReActAgentTemplates:
         overrides = self._input.templates or {}
         templates = {}
@@ -2,6 +2,8 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import datetime
+from enum import StrEnum
+from functools import cached_property
 
 from pydantic import BaseModel
 
@@ -79,8 +81,13 @@ class DefaultRunner(BaseRunner):
             schema_error=SchemaErrorTemplate,
         )
 
+    @cached_property
+    def _tool_names_enum(self) -> type[StrEnum]:
+        # tools are fixed for the lifetime of the runner, while the parser is recreated on every iteration
+        return create_strenum("ToolsEnum", [tool.name for tool in self._input.tools])
+
     def _create_parser(self) -> LinePrefixParser:
-        tool_names = create_strenum("ToolsEnum", [tool.name for tool in self._input.tools])
+        tool_names = self._tool_names_enum
 
         return LinePrefixParser(
             nodes={
@@ -194,7 +201,7 @@ class DefaultRunner(BaseRunner):
                     data.abort()
 
             output: ChatModelOutput = await self._input.llm.run(
-                self.memory.messages[:],
+                self.memory.messages,
                 stream=self._input.stream,
                 tools=self._input.tools if self.use_native_tool_calling else None,
             ).observe(lambda llm_emitter: llm_emitter.on("new_token", on_new_token))
@@ -228,15 +235,15 @@ class DefaultRunner(BaseRunner):
             )
         ).get()
 
+    @cached_property
+    def _tools_by_name(self) -> dict[str, AnyTool]:
+        tools_by_name: dict[str, AnyTool] = {}
+        for tool in self._input.tools:
+            tools_by_name.setdefault(tool.name.strip().upper(), tool)  # the first tool with a given name wins
+        return tools_by_name
+
     async def tool(self, input: ReActAgentRunnerToolInput) -> ReActAgentRunnerToolResult:
-        tool: AnyTool | None = next(
-            (
-                tool
-                for tool in self._input.tools
-                if tool.name.strip().upper() == (input.state.tool_name or "").strip().upper()
-            ),
-            None,
-        )
+        tool: AnyTool | None = self._tools_by_name.get((input.state.tool_name or "").strip().upper())
 
         if tool is None:
             self._failed_attempts_counter.use(
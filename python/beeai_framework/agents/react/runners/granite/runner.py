@@ -28,7 +28,6 @@ from beeai_framework.memory.base_memory import BaseMemory
 from beeai_framework.parsers.field import ParserField
 from beeai_framework.parsers.line_prefix import LinePrefixParser, LinePrefixParserNode, LinePrefixParserOptions
 from beeai_framework.tools import ToolOutput
-from beeai_framework.utils.strings import create_strenum
 
 
 class GraniteRunner(DefaultRunner):
@@ -62,7 +61,7 @@ class GraniteRunner(DefaultRunner):
         run.emitter.on("update", on_update, EmitterOptions(is_blocking=True))
 
     def _create_parser(self) -> LinePrefixParser:
-        tool_names = create_strenum("ToolsEnum", [tool.name for tool in self._input.tools])
+        tool_names = self._tool_names_enum
 
         return LinePrefixParser(
             nodes={
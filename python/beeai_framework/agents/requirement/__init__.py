@@ -1,7 +1,14 @@
 # Copyright 2025 © BeeAI a Series of LF Projects, LLC
 # SPDX-License-Identifier: Apache-2.0
 
-from beeai_framework.agents.requirement.agent import RequirementAgent
+from typing import TYPE_CHECKING
+
 from beeai_framework.agents.requirement.types import RequirementAgentOutput, RequirementAgentRunState
+from beeai_framework.utils.modules import lazy_module_getattr
+
+if TYPE_CHECKING:
+    from beeai_framework.agents.requirement.agent import RequirementAgent
 
 __all__ = ["RequirementAgent", "RequirementAgentOutput", "RequirementAgentRunState"]
+
+__getattr__ = lazy_module_getattr(__name__, {"RequirementAgent": "beeai_framework.agents.requirement.agent"})
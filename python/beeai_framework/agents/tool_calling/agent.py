@@ -1,14 +1,16 @@
 # Copyright 2025 © BeeAI a Series of LF Projects, LLC
 # SPDX-License-Identifier: Apache-2.0
 
-import json
 from collections.abc import Sequence
+from functools import lru_cache
+from itertools import islice
 from typing import Any, Unpack
 
 from deprecated import deprecated
 from pydantic import BaseModel, Field, create_model
 
 from beeai_framework.agents import AgentError, AgentOptions, BaseAgent
+from beeai_framework.agents._utils import index_tools, run_tools
 from beeai_framework.agents.tool_calling.events import (
     ToolCallingAgentStartEvent,
     ToolCallingAgentSuccessEvent,
@@ -44,7 +46,6 @@ from beeai_framework.memory.base_memory import BaseMemory
 from beeai_framework.memory.unconstrained_memory import UnconstrainedMemory
 from beeai_framework.runnable import runnable_entry
 from beeai_framework.template import PromptTemplate
-from beeai_framework.tools.errors import ToolError
 from beeai_framework.tools.tool import AnyTool
 from beeai_framework.tools.tool import tool as create_tool
 from beeai_framework.tools.types import StringToolOutput
@@ -53,6 +54,19 @@ from beeai_framework.utils.models import update_model
 from beeai_framework.utils.strings import find_first_pair, generate_random_string, to_json
 
 
+@lru_cache(maxsize=256)
+def _create_final_answer_schema(description: str | None) -> type[BaseModel]:
+    # building a pydantic model compiles its validator, so the class is shared across runs
+    return create_model(
+        "FinalAnswer",
+        response=(
+            str,
+            # pyrefly: ignore [no-matching-overload]
+            Field(description=description),
+        ),
+    )
+
+
 @deprecated(reason="Use RequirementAgent instead.", version="0.1.73")
 class ToolCallingAgent(BaseAgent[ToolCallingAgentOutput]):
     def __init__(
@@ -134,14 +148,7 @@ class ToolCallingAgent(BaseAgent[ToolCallingAgentOutput]):
                 and isinstance(expected_output, type)
                 and issubclass(expected_output, BaseModel)
             )
-            else create_model(
-                "FinalAnswer",
-                response=(
-                    str,
-                    # pyrefly: ignore [no-matching-overload]
-                    Field(description=expected_output or None),
-                ),
-            )
+            else _create_final_answer_schema(expected_output or None)
         )
 
         @create_tool(
@@ -159,8 +166,10 @@ class ToolCallingAgent(BaseAgent[ToolCallingAgentOutput]):
             return StringToolOutput("Message has been sent")
 
         tools = [*self._tools, final_answer_tool]
+        tools_by_name = index_tools(tools)
         tool_call_checker = self._create_tool_call_checker()
         final_answer_as_tool = self._final_answer_as_tool
+        temp_messages: list[AssistantMessage] = []
 
         while state.result is None:
             state.iteration += 1
@@ -190,6 +199,7 @@ class ToolCallingAgent(BaseAgent[ToolCallingAgentOutput]):
 
                 if not final_answer_input:
                     tools = [final_answer_tool]
+                    tools_by_name = index_tools(tools)
                     final_answer_as_tool = True
                     continue
 
@@ -204,61 +214,60 @@ class ToolCallingAgent(BaseAgent[ToolCallingAgentOutput]):
             else:
                 await state.memory.add_many(response.output)
 
+            # cycle detection runs over the calls in order; the calls that pass are then executed concurrently
+            cycle_tool_call: MessageToolCallContent | None = None
+            planned_tool_calls: list[MessageToolCallContent] = []
             for tool_call in tool_call_messages:
-                try:
-                    tool = next((tool for tool in tools if tool.name == tool_call.tool_name), None)
-                    if not tool:
-                        raise ToolError(f"Tool '{tool_call.tool_name}' does not exist!")
-
+                if tool_call.tool_name in tools_by_name:
                     tool_call_checker.register(tool_call)
                     if tool_call_checker.cycle_found:
-                        await state.memory.delete_many(response.output)
-                        await state.memory.add(
-                            UserMessage(
-                                self._templates.cycle_detection.render(
-                                    ToolCallingAgentCycleDetectionPromptInput(
-                                        tool_args=tool_call.args,
-                                        tool_name=tool_call.tool_name,
-                                        final_answer_tool=final_answer_tool.name,
-                                    )
-                                ),
-                            ),
-                        )
-                        tool_call_checker.reset(tool_call)
+                        cycle_tool_call = tool_call
                         break
-
-                    tool_input = json.loads(tool_call.args)
-                    tool_response = await tool.run(tool_input).context(
-                        {"state": state.model_dump(), "tool_call_msg": tool_call}
-                    )
-                    await state.memory.add(
-                        ToolMessage(
-                            MessageToolResultContent(
-                                result=tool_response.get_text_content(),
-                                tool_name=tool_call.tool_name,
-                                tool_call_id=tool_call.id,
-                            )
+                planned_tool_calls.append(tool_call)
+
+            tool_results = await run_tools(tools_by_name, planned_tool_calls, context={"state": state.model_dump()})
+            tool_messages: list[ToolMessage] = []
+            for tool_result in tool_results:
+                if tool_result.error is not None:
+                    global_retries_counter.use(tool_result.error)
+                    result = self._templates.tool_error.render({"reason": tool_result.error.explain()})
+                else:
+                    result = tool_result.output.get_text_content()
+
+                tool_messages.append(
+                    ToolMessage(
+                        MessageToolResultContent(
+                            result=result,
+                            tool_name=tool_result.msg.tool_name,
+                            tool_call_id=tool_result.msg.id,
                         )
                     )
-                except ToolError as e:
-                    global_retries_counter.use(e)
-                    await state.memory.add(
-                        ToolMessage(
-                            MessageToolResultContent(
-                                result=self._templates.tool_error.render({"reason": e.explain()}),
-                                tool_name=tool_call.tool_name,
-                                tool_call_id=tool_call.id,
+                )
+            await state.memory.add_many(tool_messages)
+
+            if cycle_tool_call is not None:
+                await state.memory.delete_many(response.output)
+                await state.memory.add(
+                    UserMessage(
+                        self._templates.cycle_detection.render(
+                            ToolCallingAgentCycleDetectionPromptInput(
+                                tool_args=cycle_tool_call.args,
+                                tool_name=cycle_tool_call.tool_name,
+                                final_answer_tool=final_answer_tool.name,
                             )
-                        )
-                    )
+                        ),
+                    ),
+                )
+                tool_call_checker.reset(cycle_tool_call)
 
             # handle empty messages for some models
             if not tool_call_messages and not text_messages:
-                await state.memory.add(AssistantMessage("\n", {"tempMessage": True}))
-            else:
-                await state.memory.delete_many(
-                    [msg for msg in state.memory.messages if msg.meta.get("tempMessage", False)]
-                )
+                temp_message = AssistantMessage("\n", {"tempMessage": True})
+                await state.memory.add(temp_message)
+                temp_messages.append(temp_message)
+            elif temp_messages:
+                await state.memory.delete_many(temp_messages)
+                temp_messages.clear()
 
             await run_context.emitter.emit(
                 "success",
@@ -268,7 +277,7 @@ class ToolCallingAgent(BaseAgent[ToolCallingAgentOutput]):
         assert state.result is not None
         if self._save_intermediate_steps:
             self.memory.reset()
-            await self.memory.add_many(state.memory.messages[1:])
+            await self.memory.add_many(islice(state.memory.messages, 1, None))
         else:
             if user_message is not None:
                 await self.memory.add(user_message)
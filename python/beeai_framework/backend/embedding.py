@@ -8,7 +8,7 @@ from collections.abc import Sequence
 from functools import cached_property
 from typing import Any, Self
 
-from pydantic import ConfigDict, TypeAdapter
+from pydantic import ConfigDict, InstanceOf, TypeAdapter
 from typing_extensions import TypedDict, Unpack
 
 from beeai_framework.backend.constants import ProviderName
@@ -19,8 +19,15 @@ from beeai_framework.backend.events import (
     EmbeddingModelSuccessEvent,
     embedding_model_event_types,
 )
-from beeai_framework.backend.types import EmbeddingModelInput, EmbeddingModelOutput
+from beeai_framework.backend.types import (
+    EmbeddingModelCache,
+    EmbeddingModelInput,
+    EmbeddingModelOutput,
+    EmbeddingModelUsage,
+)
 from beeai_framework.backend.utils import load_model, parse_model
+from beeai_framework.cache.base import BaseCache
+from beeai_framework.cache.null_cache import NullCache
 from beeai_framework.context import Run, RunContext, RunMiddlewareType
 from beeai_framework.emitter import Emitter
 from beeai_framework.retryable import Retryable, RetryableConfig, RetryableInput
@@ -40,6 +47,11 @@ class EmbeddingModelKwargs(TypedDict, total=False):
     List of middleware to apply during model execution.
     """
 
+    cache: InstanceOf[EmbeddingModelCache]
+    """
+    Cache implementation for storing and retrieving embeddings of individual values.
+    """
+
     settings: dict[str, Any]
     """
     Additional provider-specific settings.
@@ -65,6 +77,7 @@ class EmbeddingModel(ABC):
 
     Attributes:
         middlewares: List of middleware functions to apply during execution.
+        cache: Cache for embeddings of already seen values (disabled by default).
 
     Example:
         >>> from beeai_framework.adapters.openai import OpenAIEmbeddingModel
@@ -139,6 +152,7 @@ class EmbeddingModel(ABC):
 
         kwargs = _get_embedding_model_kwargs_adapter().validate_python(kwargs)
         self.middlewares: list[RunMiddlewareType] = [*kwargs.get("middlewares", [])]
+        self.cache: EmbeddingModelCache = kwargs.get("cache", NullCache[list[float]]())
 
     def create(
         self, values: list[str], *, signal: AbortSignal | None = None, max_retries: int | None = None
@@ -147,6 +161,8 @@ class EmbeddingModel(ABC):
 
         This method converts text strings into vector embeddings that can be used
         for semantic search, similarity comparison, clustering, and other ML tasks.
+        When a cache is configured, only values without a cached embedding are sent
+        to the provider.
 
         Args:
             values: List of text strings to convert into embeddings.
@@ -191,19 +207,11 @@ class EmbeddingModel(ABC):
             try:
                 await context.emitter.emit("start", EmbeddingModelStartEvent(input=model_input))
 
-                result = await Retryable(
-                    RetryableInput(
-                        executor=lambda _: self._create(model_input, context),
-                        config=RetryableConfig(
-                            max_retries=(
-                                model_input.max_retries
-                                if model_input is not None and model_input.max_retries is not None
-                                else 0
-                            ),
-                            signal=context.signal,
-                        ),
-                    )
-                ).get()
+                result = (
+                    await self._create_cached(model_input, context)
+                    if self.cache.enabled
+                    else await self._create_with_retries(model_input, context)
+                )
 
                 await context.emitter.emit("success", EmbeddingModelSuccessEvent(value=result))
                 return result
@@ -218,6 +226,51 @@ class EmbeddingModel(ABC):
             *self.middlewares
         )
 
+    async def _create_with_retries(self, input: EmbeddingModelInput, context: RunContext) -> EmbeddingModelOutput:
+        return await Retryable(
+            RetryableInput(
+                executor=lambda _: self._create(input, context),
+                config=RetryableConfig(
+                    max_retries=input.max_retries if input.max_retries is not None else 0,
+                    signal=context.signal,
+                ),
+            )
+        ).get()
+
+    async def _create_cached(self, input: EmbeddingModelInput, context: RunContext) -> EmbeddingModelOutput:
+        # settings (e.g. dimensions) change the produced vectors, so models that differ in them never share entries
+        scope = BaseCache.generate_key(
+            {
+                "provider_id": self.provider_id,
+                "model_id": self.model_id,
+                "settings": dict(sorted(self._settings.items())),
+            }
+        )
+        keys = [BaseCache.generate_key({"scope": scope, "value": value}) for value in input.values]
+        embeddings = [await self.cache.get(key) for key in keys]
+        missing = [idx for idx, embedding in enumerate(embeddings) if embedding is None]
+        # cached vectors are copied so callers can not modify them through the output
+        embeddings = [None if embedding is None else list(embedding) for embedding in embeddings]
+
+        usage = EmbeddingModelUsage()
+        if missing:
+            missing_input = (
+                input
+                if len(missing) == len(input.values)
+                else input.model_copy(update={"values": [input.values[idx] for idx in missing]})
+            )
+            output = await self._create_with_retries(missing_input, context)
+            for idx, embedding in zip(missing, output.embeddings, strict=True):
+                embeddings[idx] = embedding
+                await self.cache.set(keys[idx], list(embedding))
+            usage = output.usage
+
+        return EmbeddingModelOutput(
+            values=input.values,
+            embeddings=[embedding for embedding in embeddings if embedding is not None],
+            usage=usage,
+        )
+
     @staticmethod
     def from_name(name: str | ProviderName, **kwargs: Any) -> "EmbeddingModel":
         """Create an EmbeddingModel instance from a provider and model name.
@@ -250,6 +250,9 @@ class EmbeddingModelOutput(BaseModel):
     usage: InstanceOf[EmbeddingModelUsage] = EmbeddingModelUsage()
 
 
+EmbeddingModelCache = BaseCache[list[float]]
+
+
 class Document(BaseModel):
     model_config = ConfigDict(extra="allow")
 
@@ -1,5 +1,6 @@
 # Copyright 2025 © BeeAI a Series of LF Projects, LLC
 # SPDX-License-Identifier: Apache-2.0
+from functools import cache
 from importlib import import_module
 from typing import Any, Literal, TypeVar, Union
 
@@ -76,6 +77,7 @@ def parse_module(name: str) -> ProviderModuleDef:
     )
 
 
+@cache
 def load_model(name: ProviderName | str, model_type: ModelTypes = "chat") -> type[T]:
     parsed = parse_model(name)
     provider_def = parsed.provider_def
@@ -87,6 +89,7 @@ def load_model(name: ProviderName | str, model_type: ModelTypes = "chat") -> typ
     return getattr(module, class_name)  # type: ignore
 
 
+@cache
 def load_module(name: ProviderName | str, module_type: ModuleTypes = "vector_store") -> type[T]:
     def get_class_suffix(module_type: str) -> str:
         words = module_type.split("_")
@@ -3,6 +3,7 @@
 
 from collections.abc import Callable
 from enum import StrEnum
+from functools import cached_property
 from typing import Any, NoReturn
 
 from pydantic import BaseModel, InstanceOf, ValidationError
@@ -266,8 +267,9 @@ class LinePrefixParser:
                 LinePrefixParserError.Reason.InvalidSchema,
             )
 
-    @property
+    @cached_property
     def _normalized_nodes(self) -> list[tuple[str, dict[str, Any]]]:
+        # nodes are fixed for the lifetime of the parser (fork creates a new one), so this is computed once
         sorted_nodes = sorted(self._nodes.items(), key=lambda item: len(item[1].prefix))
         return [(key, {"lowerCasePrefix": node.prefix.lower(), "ref": node}) for key, node in sorted_nodes]
 
@@ -276,16 +278,17 @@ class LinePrefixParser:
         if not trimmed_line:
             return None
 
+        lower_case_line = trimmed_line.lower()
         for key, node_info in self._normalized_nodes:
             lower_case_prefix = node_info["lowerCasePrefix"]
             partial = len(lower_case_prefix) > len(trimmed_line)
             if partial:
-                a, b = lower_case_prefix, trimmed_line
+                matches = lower_case_prefix.startswith(lower_case_line)
             else:
-                a, b = trimmed_line, lower_case_prefix
+                matches = lower_case_line.startswith(lower_case_prefix)
 
-            if a.lower().startswith(b.lower()):
-                value = trimmed_line if partial else trim_left_spaces(trimmed_line[len(b) :])
+            if matches:
+                value = trimmed_line if partial else trim_left_spaces(trimmed_line[len(lower_case_prefix) :])
                 return LinePrefixParserExtractedLine(key=key, value=value, partial=partial)
 
         return None
@@ -105,7 +105,8 @@ def runnable_entry(handler: Callable[P, Awaitable[R]]) -> Callable[P, Run[R]]:
         async def inner(ctx: RunContext) -> R:
             # Use potentially modified input from run_params instead of original args
             modified_input = ctx.run_params.get("input", args[1] if len(args) > 1 else None)
-            modified_args = (args[0], modified_input, *args[2:])
+            # Re-pack the arguments only when a middleware has actually replaced the input
+            modified_args = args if modified_input is args[1] else (args[0], modified_input, *args[2:])
             # pyrefly: ignore [invalid-param-spec]
             return await handler(*modified_args, **kwargs)
 
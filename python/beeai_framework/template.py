@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from collections.abc import Callable
+from functools import lru_cache
 from typing import Any, Generic, Self, TypeVar, overload
 
 import chevron
@@ -14,6 +15,12 @@ from beeai_framework.utils.models import ModelLike, to_model_optional
 T = TypeVar("T", bound=BaseModel)
 
 
+@lru_cache(maxsize=256)
+def _tokenize(template: str) -> tuple[tuple[str, str], ...]:
+    # chevron accepts a pre-tokenized template, so each distinct template string is parsed only once
+    return tuple(chevron.tokenizer.tokenize(template))
+
+
 class PromptTemplateInput(BaseModel, Generic[T]):
     input_schema: type[T] = Field(..., alias="schema")
     template: str
@@ -95,7 +102,7 @@ class PromptTemplate(Generic[T]):
                 raise PromptTemplateError(f"Function named '{key}' clashes with input data field!")
             data[key] = self._config.functions[key](data)
 
-        return chevron.render(template=self._config.template, data=data)
+        return chevron.render(template=_tokenize(self._config.template), data=data)
 
     def fork(
         self, customizer: Callable[[PromptTemplateInput[Any]], PromptTemplateInput[Any]] | None
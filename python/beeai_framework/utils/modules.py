@@ -0,0 +1,29 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+import importlib
+import sys
+from collections.abc import Callable
+from typing import Any
+
+
+def lazy_module_getattr(module_name: str, attributes: dict[str, str]) -> Callable[[str], Any]:
+    """Creates a module level `__getattr__` which imports the given attributes on first access.
+
+    Args:
+        module_name: The name of the module the `__getattr__` is defined in (`__name__`).
+        attributes: Maps each attribute name to the module it is imported from.
+
+    Returns:
+        The `__getattr__` function to be assigned in the module.
+    """
+
+    def _getattr(name: str) -> Any:
+        if name not in attributes:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+
+        value = getattr(importlib.import_module(attributes[name]), name)
+        setattr(sys.modules[module_name], name, value)  # subsequent lookups bypass __getattr__
+        return value
+
+    return _getattr
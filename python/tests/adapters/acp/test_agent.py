@@ -0,0 +1,117 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import json
+import threading
+from collections.abc import Generator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+import httpx
+import pytest
+
+pytest.importorskip("acp_sdk", reason="Optional module [acp] not installed.")
+
+import acp_sdk.models as acp_models
+
+from beeai_framework.adapters.acp.agents import ACPAgent
+from beeai_framework.memory import UnconstrainedMemory
+
+AGENT_URL = "http://acp.example.com/api"
+
+
+def _completed_event(text: str) -> str:
+    run = acp_models.Run(
+        agent_name="echo",
+        status=acp_models.RunStatus.COMPLETED,
+        output=[acp_models.Message(parts=[acp_models.MessagePart(content=text, role="agent")])],  # type: ignore[call-arg]
+    )
+    return f"data: {acp_models.RunCompletedEvent(run=run).model_dump_json()}\n\n"
+
+
+def _create_transport(requests: list[httpx.Request]) -> httpx.MockTransport:
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.url.path.endswith("/agents"):
+            return httpx.Response(200, json={"agents": [{"name": "echo"}]})
+        if "/sessions/" in request.url.path:
+            return httpx.Response(404, json={"code": "not_found", "message": "Session not found"})
+        return httpx.Response(
+            200, headers={"content-type": "text/event-stream"}, content=_completed_event("Hello!").encode()
+        )
+
+    return httpx.MockTransport(handler)
+
+
+@pytest.fixture
+def keep_alive_server_url() -> Generator[str, None, None]:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keeps the connection open between requests
+
+        def do_GET(self) -> None:  # noqa: N802
+            body = json.dumps({"agents": [{"name": "echo"}]}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}/api"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.mark.unit
+def test_runs_from_different_event_loops(keep_alive_server_url: str) -> None:
+    agent = ACPAgent("echo", url=keep_alive_server_url, memory=UnconstrainedMemory())
+
+    # connections opened by the first loop must not be reused once that loop is closed
+    asyncio.run(agent.check_agent_exists())
+    asyncio.run(agent.check_agent_exists())
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_provided_http_client_pool_is_reused_across_runs() -> None:
+    requests: list[httpx.Request] = []
+    http_client = httpx.AsyncClient(transport=_create_transport(requests))
+    agent = ACPAgent("echo", url=AGENT_URL, memory=UnconstrainedMemory(), http_client=http_client)
+
+    await agent.run("Hi!")
+    await (await agent.clone()).run("Hi again!")
+
+    # the mock transport stands in for the client's connection pool, any other client could not reach the agent
+    assert [request.url.path for request in requests if request.url.path == "/api/runs"] == ["/api/runs"] * 2
+    await http_client.aclose()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_provided_http_client_is_shared_and_left_open() -> None:
+    requests: list[httpx.Request] = []
+    http_client = httpx.AsyncClient(transport=_create_transport(requests))
+    agent = ACPAgent("echo", url=AGENT_URL, memory=UnconstrainedMemory(), http_client=http_client)
+
+    await agent.check_agent_exists()
+    response = await agent.run("Hi!")
+    cloned = await agent.clone()
+
+    assert response.last_message.text == "Hello!"
+    assert all(str(request.url).startswith(f"{AGENT_URL}/") for request in requests)
+    assert [request.url.path for request in requests if not request.url.path.startswith("/api/sessions/")] == [
+        "/api/agents",
+        "/api/runs",
+    ]
+    assert cloned._http_client is http_client
+    assert not http_client.is_closed
+    await http_client.aclose()
@@ -0,0 +1,50 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+
+def _run_isolated(code: str) -> None:
+    # other tests import the modules eagerly, so the check needs a fresh interpreter
+    subprocess.run([sys.executable, "-c", textwrap.dedent(code)], check=True)
+
+
+@pytest.mark.unit
+def test_agents_package_defers_agent_and_server_modules() -> None:
+    _run_isolated(
+        """
+        import sys
+
+        import beeai_framework.adapters.watsonx_orchestrate.agents as agents
+
+        assert "beeai_framework.adapters.watsonx_orchestrate.serve.server" not in sys.modules
+        assert "beeai_framework.adapters.watsonx_orchestrate.agents.agent" not in sys.modules
+
+        agents.WatsonxOrchestrateAgent
+        assert "beeai_framework.adapters.watsonx_orchestrate.agents.agent" in sys.modules
+        assert "beeai_framework.adapters.watsonx_orchestrate.serve.server" not in sys.modules
+        """
+    )
+
+
+@pytest.mark.unit
+def test_package_loads_the_server_on_first_access() -> None:
+    _run_isolated(
+        """
+        import sys
+
+        import beeai_framework.adapters.watsonx_orchestrate as watsonx_orchestrate
+
+        assert "beeai_framework.adapters.watsonx_orchestrate.serve.server" not in sys.modules
+
+        from beeai_framework.adapters.watsonx_orchestrate import WatsonxOrchestrateServer
+        from beeai_framework.adapters.watsonx_orchestrate.serve.server import WatsonxOrchestrateServer as server_cls
+
+        assert WatsonxOrchestrateServer is server_cls
+        assert "WatsonxOrchestrateServer" in vars(watsonx_orchestrate)
+        """
+    )
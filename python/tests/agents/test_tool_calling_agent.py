@@ -1,11 +1,14 @@
 # Copyright 2025 © BeeAI a Series of LF Projects, LLC
 # SPDX-License-Identifier: Apache-2.0
 
+import asyncio
+
 import pytest
 
 from beeai_framework.agents import AgentError
 from beeai_framework.agents.tool_calling.agent import ToolCallingAgent
 from beeai_framework.backend import AssistantMessage, ToolMessage
+from beeai_framework.tools import tool
 from tests.agents._scripted import (
     ScriptedChatModel,
     final_answer_message,
@@ -58,6 +61,97 @@ async def test_executes_tool_then_final_answer() -> None:
     assert "sunny in Prague" in tool_results
 
 
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_executes_multiple_tool_calls_in_order() -> None:
+    prague, brno = (
+        tool_call_message("weather_tool", {"city": city}, call_id=call_id).content[0]
+        for city, call_id in (("Prague", "c1"), ("Brno", "c2"))
+    )
+    model = ScriptedChatModel([[AssistantMessage([prague, brno])], [final_answer_message("Sunny everywhere")]])
+    model.allow_parallel_tool_calls = True
+    agent = ToolCallingAgent(llm=model, tools=[weather_tool])
+
+    output = await agent.run("What is the weather in Prague and Brno?")
+
+    tool_results = [
+        (content.tool_call_id, content.result)
+        for message in output.state.memory.messages
+        if isinstance(message, ToolMessage)
+        for content in message.get_tool_results()
+        if content.tool_name == "weather_tool"
+    ]
+    assert tool_results == [("c1", "sunny in Prague"), ("c2", "sunny in Brno")]
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_executes_multiple_tool_calls_concurrently() -> None:
+    ping_started, pong_started = asyncio.Event(), asyncio.Event()
+
+    @tool
+    async def ping_tool() -> str:
+        """Waits for the pong tool."""
+
+        ping_started.set()
+        await pong_started.wait()
+        return "ping"
+
+    @tool
+    async def pong_tool() -> str:
+        """Waits for the ping tool."""
+
+        pong_started.set()
+        await ping_started.wait()
+        return "pong"
+
+    ping, pong = (
+        tool_call_message(name, {}, call_id=call_id).content[0]
+        for name, call_id in (("ping_tool", "c1"), ("pong_tool", "c2"))
+    )
+    model = ScriptedChatModel([[AssistantMessage([ping, pong])], [final_answer_message("done")]])
+    model.allow_parallel_tool_calls = True
+    agent = ToolCallingAgent(llm=model, tools=[ping_tool, pong_tool])
+
+    # each tool only finishes once the other one has started, so running them one by one would never complete
+    output = await asyncio.wait_for(agent.run("Play ping pong"), timeout=5)
+
+    tool_results = [
+        (content.tool_call_id, content.result)
+        for message in output.state.memory.messages
+        if isinstance(message, ToolMessage)
+        for content in message.get_tool_results()
+        if content.tool_name in {"ping_tool", "pong_tool"}
+    ]
+    assert tool_results == [("c1", "ping"), ("c2", "pong")]
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_first_tool_with_duplicate_name_is_executed() -> None:
+    @tool(name="weather_tool")
+    def shadowed_weather_tool(city: str) -> str:
+        """Returns the weather for a city."""
+
+        return f"rainy in {city}"
+
+    model = ScriptedChatModel(
+        [[tool_call_message("weather_tool", {"city": "Prague"})], [final_answer_message("It is sunny in Prague")]]
+    )
+    agent = ToolCallingAgent(llm=model, tools=[weather_tool, shadowed_weather_tool])
+
+    output = await agent.run("What is the weather in Prague?")
+
+    tool_results = [
+        content.result
+        for message in output.state.memory.messages
+        if isinstance(message, ToolMessage)
+        for content in message.get_tool_results()
+        if content.tool_name == "weather_tool"
+    ]
+    assert tool_results == ["sunny in Prague"]
+
+
 @pytest.mark.asyncio
 @pytest.mark.unit
 async def test_final_answer_tool_is_always_offered() -> None:
@@ -14,6 +14,7 @@ from litellm.types.utils import (
     Message,
     StreamingChoices,
 )
+from pydantic import BaseModel
 
 from beeai_framework.adapters.litellm.chat import LiteLLMChatModel
 from beeai_framework.backend.constants import ProviderName
@@ -22,7 +23,10 @@ from beeai_framework.backend.message import (
     MessageReasoningContent,
     MessageTextContent,
     MessageToolCallContent,
+    UserMessage,
 )
+from beeai_framework.backend.types import ChatModelInput
+from beeai_framework.tools import tool
 
 
 class DummyLiteLLMChatModel(LiteLLMChatModel):
@@ -338,3 +342,29 @@ class TestTransformOutput:
         texts = result.output[0].get_by_type(MessageTextContent)
         assert len(texts) == 1
         assert texts[0].text == "plain"
+
+
+@pytest.mark.unit
+def test_transform_input_skips_tool_schemas_for_structured_output(monkeypatch: pytest.MonkeyPatch) -> None:
+    class Answer(BaseModel):
+        text: str
+
+    @tool()
+    def search(query: str) -> str:
+        """Searches the web."""
+
+        return query
+
+    model = DummyLiteLLMChatModel()
+
+    def fail(*args: Any, **kwargs: Any) -> dict[str, Any]:
+        raise AssertionError("tool schemas must not be built for structured output requests")
+
+    monkeypatch.setattr(model, "_format_tool_model", fail)
+    request = model._transform_input(
+        ChatModelInput(messages=[UserMessage("Hi!")], tools=[search], tool_choice="auto", response_format=Answer)
+    )
+
+    assert "tools" not in request
+    assert "tool_choice" not in request
+    assert "response_format" in request
@@ -4,7 +4,9 @@ import json
 import os
 
 import pytest
+import torch
 
+from beeai_framework.adapters.transformers.backend._utils import get_balanced_max_memory
 from beeai_framework.adapters.transformers.backend.chat import TransformersChatModel
 from beeai_framework.backend import (
     AnyMessage,
@@ -71,3 +73,24 @@ class TestTransformersChatModel:
         response = await self.chat_model.run(messages, tools=[tool])
         assert response.last_message.text != ""
         print(response.last_message.text)
+
+
+@pytest.mark.unit
+def test_balanced_max_memory_requires_multiple_gpus(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(torch.cuda, "is_available", lambda: True)
+    monkeypatch.setattr(torch.cuda, "device_count", lambda: 1)
+    assert get_balanced_max_memory() is None
+
+
+@pytest.mark.unit
+def test_balanced_max_memory_leaves_headroom_on_first_gpu(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(torch.cuda, "is_available", lambda: True)
+    monkeypatch.setattr(torch.cuda, "device_count", lambda: 2)
+    monkeypatch.setattr(torch.cuda, "mem_get_info", lambda idx: (1000 * 2**20, 2000 * 2**20))
+
+    max_memory = get_balanced_max_memory(first_gpu_ratio=0.5, gpu_ratio=0.9)
+
+    assert max_memory is not None
+    assert max_memory[0] == "500MiB"
+    assert max_memory[1] == "900MiB"
+    assert "cpu" in max_memory
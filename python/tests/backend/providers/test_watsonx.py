@@ -76,6 +76,14 @@ class TestWatsonxChatModel:
         model = WatsonxChatModel()
         assert model._settings["project_id"] == "env-project"
 
+    @pytest.mark.unit
+    def test_settings_take_precedence_over_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("WATSONX_PROJECT_ID", "env-project")
+        monkeypatch.setenv("WATSONX_URL", "https://env.example.com")
+        model = WatsonxChatModel(settings={"project_id": "kwarg-project", "api_base": "https://alias.example.com"})
+        assert model._settings["project_id"] == "kwarg-project"
+        assert model._settings["base_url"] == "https://alias.example.com"
+
     @pytest.mark.unit
     def test_region_defaults_and_builds_base_url(self) -> None:
         model = WatsonxChatModel(project_id="test-project")
@@ -0,0 +1,135 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+from typing_extensions import Unpack
+
+from beeai_framework.backend.embedding import EmbeddingModel, EmbeddingModelKwargs
+from beeai_framework.backend.types import EmbeddingModelInput, EmbeddingModelOutput, EmbeddingModelUsage
+from beeai_framework.cache import UnconstrainedCache
+from beeai_framework.context import RunContext
+
+"""
+Utility functions and classes
+"""
+
+
+class LengthDummyEmbeddingModel(EmbeddingModel):
+    """Dummy model that embeds every value as its length and records the values it was called with"""
+
+    model_id = "length_model"
+    # pyrefly: ignore [bad-override]
+    provider_id = "ollama"
+
+    def __init__(self, **kwargs: Unpack[EmbeddingModelKwargs]) -> None:
+        super().__init__(**kwargs)
+        self.calls: list[list[str]] = []
+
+    # pyrefly: ignore [bad-param-name-override]
+    async def _create(self, input: EmbeddingModelInput, _: RunContext) -> EmbeddingModelOutput:
+        self.calls.append(input.values)
+        return EmbeddingModelOutput(
+            values=input.values,
+            embeddings=[[float(len(value))] for value in input.values],
+            usage=EmbeddingModelUsage(prompt_tokens=len(input.values), total_tokens=len(input.values)),
+        )
+
+
+"""
+Unit Tests
+"""
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_create_without_cache() -> None:
+    model = LengthDummyEmbeddingModel()
+
+    await model.create(["a", "bb"])
+    await model.create(["a", "bb"])
+
+    assert model.calls == [["a", "bb"], ["a", "bb"]]
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_create_only_embeds_cache_misses() -> None:
+    model = LengthDummyEmbeddingModel(cache=UnconstrainedCache())
+
+    first = await model.create(["a", "bb"])
+    second = await model.create(["ccc", "a", "bb", "dddd"])
+    third = await model.create(["bb", "a"])
+
+    assert model.calls == [["a", "bb"], ["ccc", "dddd"]]
+    assert first.embeddings == [[1.0], [2.0]]
+    assert second.values == ["ccc", "a", "bb", "dddd"]
+    assert second.embeddings == [[3.0], [1.0], [2.0], [4.0]]
+    assert second.usage.prompt_tokens == 2
+    assert third.embeddings == [[2.0], [1.0]]
+    assert third.usage.total_tokens == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_cache_is_scoped_by_settings() -> None:
+    cache = UnconstrainedCache[list[float]]()
+    small = LengthDummyEmbeddingModel(cache=cache, settings={"dimensions": 256})
+    large = LengthDummyEmbeddingModel(cache=cache, settings={"dimensions": 1024})
+
+    await small.create(["a"])
+    await large.create(["a"])
+    await small.create(["a"])
+
+    assert small.calls == [["a"]]
+    assert large.calls == [["a"]]
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_cached_embeddings_are_copied() -> None:
+    model = LengthDummyEmbeddingModel(cache=UnconstrainedCache())
+
+    first = await model.create(["a"])
+    first.embeddings[0].append(0.0)
+    second = await model.create(["a"])
+    second.embeddings[0].append(0.0)
+    third = await model.create(["a"])
+
+    assert third.embeddings == [[1.0]]
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_agentstack_embedding_model_uses_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    pytest.importorskip("agentstack_sdk", reason="Optional module [agentstack] not installed.")
+    from beeai_framework.adapters.agentstack.backend.embedding import AgentstackEmbeddingModel
+    from beeai_framework.adapters.openai import OpenAIEmbeddingModel
+
+    calls: list[list[str]] = []
+
+    async def _create(self: EmbeddingModel, input: EmbeddingModelInput, _: RunContext) -> EmbeddingModelOutput:
+        calls.append(input.values)
+        return EmbeddingModelOutput(values=input.values, embeddings=[[float(len(value))] for value in input.values])
+
+    monkeypatch.setattr(OpenAIEmbeddingModel, "_create", _create)
+
+    class EmbeddingFulfillment:
+        api_model = "openai:text-embedding-3-small"
+        api_key = "dummy"
+        api_base = "http://localhost"
+
+    class EmbeddingExtension:
+        def __init__(self) -> None:
+            self.data = type("Data", (), {"embedding_fulfillments": {"default": EmbeddingFulfillment()}})()
+
+    extension = EmbeddingExtension()
+    reset = AgentstackEmbeddingModel.set_context(extension)  # type: ignore[arg-type]
+    try:
+        model = AgentstackEmbeddingModel(cache=UnconstrainedCache())
+        await model.create(["a", "bb"])
+        response = await model.create(["bb", "a"])
+    finally:
+        reset()
+
+    assert calls == [["a", "bb"]]
+    assert response.embeddings == [[2.0], [1.0]]
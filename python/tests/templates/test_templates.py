@@ -83,3 +83,10 @@ def test_render_function_clash(template: PromptTemplate[Any]) -> None:
 
     with pytest.raises(PromptTemplateError):
         template.render(TestPromptInputSchema(task="Here is a task!"))
+
+
+@pytest.mark.unit
+def test_render_after_template_update(template: PromptTemplate[Any]) -> None:
+    assert template.render({"task": "Test", "count": 1}) == "This is the task: Test1"
+    template.update(template="{{=<% %>=}}Task <%task%> #<%count%>")
+    assert template.render({"task": "Test", "count": 2}) == "Task Test #2"
@@ -0,0 +1,20 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+
+import beeai_framework.agents.react as react_module
+
+
+@pytest.mark.unit
+def test_lazy_module_getattr_imports_on_first_access() -> None:
+    from beeai_framework.agents.react.agent import ReActAgent
+
+    assert react_module.ReActAgent is ReActAgent
+    assert vars(react_module)["ReActAgent"] is ReActAgent
+
+
+@pytest.mark.unit
+def test_lazy_module_getattr_rejects_unknown_attributes() -> None:
+    with pytest.raises(AttributeError, match="has no attribute 'Unknown'"):
+        _ = react_module.Unknown  # type: ignore[attr-defined]